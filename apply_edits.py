@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""Apply every p2p/src/network.rs edit in a single pass.
+
+The file is read once, all edits run back-to-back in memory and the result is
+written once. fix_network_syntax.py and the update_*.py scripts are thin
+wrappers that run selected edits from here. scripts/apply_edits.sh runs the
+full set without starting Python when nothing is left to do.
+
+The edits match LF text. A CRLF network.rs is converted to LF for editing and
+written back with CRLF, as the original text-mode scripts read it.
+"""
+import contextlib
+import hashlib
+import mmap
+import os
+import stat
+import sys
+
+PATH = 'p2p/src/network.rs'
+
+# Digest of network.rs after the last full run of EDITS. scripts/apply_edits.sh
+# reads this path and recomputes the digest with b2sum; keep both in sync
+STAMP = 'p2p/src/.network.rs.applied'
+
+# Every edit here is a literal find/replace: no `re` unless the edit is truly
+# non-literal.
+
+# Tokens of the leftover NetworkEvent fragment removed by fix_syntax
+_NEEDLE = b'NewListenAddr'
+_COMMA = b','
+
+# The current run method runs from this header to the first closing brace at
+# method indentation
+_RUN_DOC = '    /// Run the network event loop'
+_RUN_HEAD = _RUN_DOC + '\n    pub async fn run(&mut self) {'
+_RUN_TAIL = '\n    }'
+
+_OLD_SIGNATURE = 'pub fn new(config: NetworkConfig) -> anyhow::Result<(Self, mpsc::UnboundedReceiver<NetworkEvent>)>'
+_NEW_SIGNATURE = 'pub fn new(config: NetworkConfig) -> anyhow::Result<(Self, crate::service::NetworkHandle, mpsc::UnboundedReceiver<crate::service::NetworkEvent>)>'
+
+# Return statement at the end of new(), before and after, without indentation
+_OLD_RETURN_BLOCK = (
+    "Ok((\n"
+    "    Self {\n"
+    "        swarm,\n"
+    "        peers: HashMap::new(),\n"
+    "        event_tx,\n"
+    "        blocks_topic,\n"
+    "        transactions_topic,\n"
+    "    },\n"
+    "    event_rx,\n"
+    "))"
+)
+# Present only once the new return block is in place
+_NEW_RETURN_MARKER = "crate::service::NetworkHandle::new(command_tx)"
+_NEW_RETURN_BLOCK = (
+    "// Create command channel\n"
+    "let (command_tx, command_rx) = mpsc::unbounded_channel();\n"
+    "let network_handle = crate::service::NetworkHandle::new(command_tx);\n"
+    "\n"
+    "Ok((\n"
+    "    Self {\n"
+    "        swarm,\n"
+    "        peers: HashMap::new(),\n"
+    "        event_tx,\n"
+    "        blocks_topic,\n"
+    "        transactions_topic,\n"
+    "    },\n"
+    "    network_handle,\n"
+    "    event_rx,\n"
+    "))"
+)
+
+# Gossipsub message handling
+_OLD_HANDLING = '''            SwarmEvent::Behaviour(BoundlessBehaviourEvent::Gossipsub(gossipsub::Event::Message {
+                propagation_source: peer_id,
+                message_id,
+                message,
+            })) => {
+                // Deserialize and forward message
+                match Message::from_bytes(&message.data) {
+                    Ok(msg) => {
+                        info!("📩 Received {} from {}", msg.message_type(), peer_id);
+                        let _ = self.event_tx.send(NetworkEvent::MessageReceived {
+                            peer_id,
+                            message: msg,
+                        });
+                    }
+                    Err(e) => {
+                        warn!("Failed to deserialize message from {}: {}", peer_id, e);
+                    }
+                }
+            }'''
+
+_NEW_HANDLING = '''            SwarmEvent::Behaviour(BoundlessBehaviourEvent::Gossipsub(gossipsub::Event::Message {
+                propagation_source: peer_id,
+                message_id,
+                message,
+            })) => {
+                // Deserialize and forward message
+                match Message::from_bytes(&message.data) {
+                    Ok(msg) => {
+                        info!("📩 Received {} from {}", msg.message_type(), peer_id);
+                        self.dispatch_message(peer_id, msg);
+                    }
+                    Err(e) => {
+                        warn!("Failed to deserialize message from {}: {}", peer_id, e);
+                    }
+                }
+            }'''
+
+# Converts a decoded gossipsub Message into NetworkEvents. Emitted once as its
+# own method so the message handler arm stays a single call
+_DISPATCH_IMPL = '''    /// Convert a gossipsub message into the matching NetworkEvent(s)
+    fn dispatch_message(&self, peer_id: PeerId, msg: Message) {
+        use crate::service::NetworkEvent;
+
+        match msg {
+            Message::NewBlock { block } => {
+                let _ = self.event_tx.send(NetworkEvent::BlockReceived {
+                    peer_id,
+                    block,
+                });
+            }
+            Message::NewTransaction { transaction } => {
+                let _ = self.event_tx.send(NetworkEvent::TransactionReceived {
+                    peer_id,
+                    transaction,
+                });
+            }
+            Message::Status { height, best_block_hash, .. } => {
+                let _ = self.event_tx.send(NetworkEvent::StatusReceived {
+                    peer_id,
+                    height,
+                    best_hash: best_block_hash,
+                });
+            }
+            Message::GetBlocks { start_height, count } => {
+                let _ = self.event_tx.send(NetworkEvent::BlocksRequested {
+                    peer_id,
+                    start_height,
+                    count,
+                });
+            }
+            Message::Blocks { blocks } => {
+                // Handle multiple blocks by emitting multiple BlockReceived events
+                for block in blocks {
+                    let _ = self.event_tx.send(NetworkEvent::BlockReceived {
+                        peer_id,
+                        block,
+                    });
+                }
+            }
+            Message::GetStatus => {
+                // Ignore or log - we could add StatusRequested event if needed
+                info!("Received GetStatus request from {}", peer_id);
+            }
+            Message::Ping { nonce } => {
+                // Respond with pong
+                info!("Received ping from {} (nonce: {})", peer_id, nonce);
+            }
+            Message::Pong { nonce } => {
+                info!("Received pong from {} (nonce: {})", peer_id, nonce);
+            }
+        }
+    }
+
+'''
+
+# New run method implementation
+_NEW_RUN_IMPL = '''    /// Run the network event loop (takes ownership, spawned in dedicated task)
+    pub async fn run(
+        mut self,
+        mut command_rx: tokio::sync::mpsc::UnboundedReceiver<crate::service::NetworkCommand>,
+    ) {
+        use crate::service::NetworkCommand;
+
+        info!("▶️  Starting P2P network event loop");
+
+        loop {
+            tokio::select! {
+                Some(command) = command_rx.recv() => {
+                    self.handle_command(command).await;
+                }
+                event = self.swarm.select_next_some() => {
+                    self.handle_swarm_event(event).await;
+                }
+            }
+        }
+    }
+
+    async fn handle_command(&mut self, command: NetworkCommand) {
+        match command {
+            NetworkCommand::BroadcastBlock(block) => {
+                let message = Message::NewBlock { block: (*block).clone() };
+                if let Ok(data) = message.to_bytes() {
+                    if let Err(e) = self.swarm.behaviour_mut().gossipsub.publish(
+                        self.blocks_topic.clone(),
+                        data
+                    ) {
+                        warn!("Failed to broadcast block: {}", e);
+                    } else {
+                        info!("📢 Broadcasted block #{}", block.header.height);
+                    }
+                }
+            }
+
+            NetworkCommand::BroadcastTransaction(tx) => {
+                let message = Message::NewTransaction { transaction: (*tx).clone() };
+                if let Ok(data) = message.to_bytes() {
+                    if let Err(e) = self.swarm.behaviour_mut().gossipsub.publish(
+                        self.transactions_topic.clone(),
+                        data
+                    ) {
+                        warn!("Failed to broadcast transaction: {}", e);
+                    }
+                }
+            }
+
+            NetworkCommand::SendStatus { peer_id, height, best_hash } => {
+                let message = Message::Status { height, best_hash };
+                if let Ok(data) = message.to_bytes() {
+                    if let Err(e) = self.swarm.behaviour_mut().gossipsub.publish(
+                        self.blocks_topic.clone(),
+                        data
+                    ) {
+                        warn!("Failed to send status: {}", e);
+                    }
+                }
+            }
+
+            NetworkCommand::RequestBlocks { peer_id, start_height, count } => {
+                let message = Message::GetBlocks { start_height, count };
+                if let Ok(data) = message.to_bytes() {
+                    if let Err(e) = self.swarm.behaviour_mut().gossipsub.publish(
+                        self.blocks_topic.clone(),
+                        data
+                    ) {
+                        warn!("Failed to request blocks: {}", e);
+                    }
+                }
+            }
+        }
+    }'''
+
+# First line of the new run method, present once it is in place
+_NEW_RUN_DOC = _NEW_RUN_IMPL.partition('\n')[0]
+
+
+def literal_sub(haystack, old, new):
+    """Replace every ``old`` in ``haystack`` with ``new``.
+
+    The ``in`` test guarantees no copy is made when ``old`` is absent,
+    whatever the Python version's str.replace does in that case.
+    """
+    return haystack.replace(old, new) if old in haystack else haystack
+
+
+def fix_syntax(data):
+    """Remove the leftover NetworkEvent enum fragment (lines with comma and NewListenAddr)."""
+    # Single pass over the bytes: jump between NewListenAddr hits and copy the
+    # surviving regions into one output buffer. The output can only shrink, so
+    # it is allocated once at the input size and truncated at the end
+    out = bytearray(len(data))
+    size = 0
+    copied = 0
+
+    # Both views are released before the end: out cannot be resized while it
+    # is exported, and a caller's mmap cannot be closed while it is
+    with memoryview(data) as mv, memoryview(out) as dst:
+        # Only hits after the first newline can have a comma line before them,
+        # so start there and every hit below is guaranteed a previous line
+        first_nl = data.find(b'\n')
+        pos = -1 if first_nl == -1 else data.find(_NEEDLE, first_nl + 1)
+        while pos != -1:
+            line_start = data.rfind(b'\n', 0, pos) + 1
+            prev_start = data.rfind(b'\n', 0, line_start - 1) + 1
+            # Skip the leftover fragment. The in-place comma search runs first so
+            # only candidate lines are sliced and stripped. A comma line inside an
+            # already skipped fragment still starts a new one, with nothing new
+            # to copy before it
+            if (data.find(_COMMA, prev_start, line_start) != -1
+                    and data[prev_start:line_start].strip() == _COMMA):
+                # Skip comma line, NewListenAddr line and the two lines after it
+                frag_end = line_start
+                for _ in range(3):
+                    nl = data.find(b'\n', frag_end)
+                    frag_end = len(data) if nl == -1 else nl + 1
+
+                if prev_start > copied:
+                    n = prev_start - copied
+                    dst[size:size + n] = mv[copied:prev_start]
+                    size += n
+                copied = frag_end
+
+            pos = data.find(_NEEDLE, pos + 1)
+
+        n = len(data) - copied
+        dst[size:size + n] = mv[copied:]
+        size += n
+
+    del out[size:]
+    return out
+
+
+def _missing(what):
+    print(f"⚠️  {what} not found, skipping", file=sys.stderr)
+    return False
+
+
+def update_handling(content):
+    """Emit specific NetworkEvent variants from the gossipsub message handler."""
+    # The handler appears once, so stop at the first hit instead of letting
+    # str.replace scan the rest of the file
+    idx = content.find(_OLD_HANDLING)
+    if idx == -1:
+        return content, _NEW_HANDLING in content or _missing("Gossipsub message handler")
+    return content[:idx] + _NEW_HANDLING + content[idx + len(_OLD_HANDLING):], True
+
+
+def add_dispatch(content):
+    """Add NetworkNode::dispatch_message() for the updated message handler."""
+    # Insert ahead of run(), whose doc comment starts the same before and after
+    # update_run
+    if 'self.dispatch_message(' not in content or 'fn dispatch_message(' in content:
+        return content, True
+    idx = content.find(_RUN_DOC)
+    if idx == -1:
+        return content, _missing("NetworkNode::run() for dispatch_message()")
+    return content[:idx] + _DISPATCH_IMPL + content[idx:], True
+
+
+def update_run(content):
+    """Replace NetworkNode::run() and add handle_command()."""
+    start = content.find(_RUN_HEAD)
+    if start == -1:
+        # Skipped when the run method has already been replaced
+        return content, _NEW_RUN_DOC in content or _missing("NetworkNode::run()")
+    end = content.find(_RUN_TAIL, start + len(_RUN_HEAD))
+    if end == -1:
+        return content, _missing("End of NetworkNode::run()")
+    end += len(_RUN_TAIL)
+    return content[:start] + _NEW_RUN_IMPL + content[end:], True
+
+
+def _indent(block, indent):
+    """Prefix every non-blank line of ``block`` with ``indent``.
+
+    Same result as textwrap.indent(), without pulling in re through textwrap.
+    """
+    return ''.join(indent + line if line.strip() else line
+                   for line in block.splitlines(keepends=True))
+
+
+def update_new(content):
+    """Make NetworkNode::new() return a NetworkHandle."""
+    # Change the return type; afterwards the new signature is present exactly
+    # when either form was
+    content = literal_sub(content, _OLD_SIGNATURE, _NEW_SIGNATURE)
+    found = True
+    if _NEW_SIGNATURE not in content:
+        found = _missing("NetworkNode::new() signature")
+
+    # Find the `Ok((Self { ... }, event_rx))` return and splice in the new
+    # block; the fragment is fixed, so a literal search is enough
+    start = content.find('Ok((\n')
+    while start != -1:
+        line_start = content.rfind('\n', 0, start) + 1
+        indent = content[line_start:start]
+        old = _indent(_OLD_RETURN_BLOCK, indent)
+        if not indent.strip() and content.startswith(old, line_start):
+            end = line_start + len(old)
+            content = content[:line_start] + _indent(_NEW_RETURN_BLOCK, indent) + content[end:]
+            return content, found
+        start = content.find('Ok((\n', start + 1)
+
+    if _NEW_RETURN_MARKER not in content:
+        found = _missing("NetworkNode::new() return statement")
+    return content, found
+
+
+EDITS = [
+    (update_handling, "✅ Updated message handling to emit specific NetworkEvent variants"),
+    (add_dispatch, "✅ Added NetworkNode::dispatch_message()"),
+    (update_run, "✅ Updated NetworkNode::run() and added handle_command()"),
+    (update_new, "✅ Updated NetworkNode::new() to return NetworkHandle"),
+]
+
+
+def _digest(data):
+    # The driver's own source goes in first, so changing any edit invalidates
+    # stamps written by an older version. scripts/apply_edits.sh computes the
+    # same value as `cat apply_edits.py network.rs | b2sum -l 128`; update it
+    # with any change to the format here
+    h = hashlib.blake2b(digest_size=16)
+    with open(__file__, 'rb') as f:
+        h.update(f.read())
+    h.update(data)
+    return h.hexdigest()
+
+
+def _read_stamp():
+    try:
+        with open(STAMP) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write(path, data):
+    """Write ``data`` to a sibling temp file and rename it over ``path``.
+
+    An interrupted run leaves either the old or the new file in place, never a
+    truncated one.
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+    os.replace(tmp, path)
+
+
+def run(edits=EDITS, fix=True):
+    """Apply ``edits`` to network.rs, reading and writing the file once."""
+    # Map the file instead of reading it: the syntax fix searches the mapped
+    # pages directly and only the final text is decoded. An empty file cannot
+    # be mapped, so it is handled as empty bytes
+    with open(PATH, 'rb') as f, (
+            contextlib.nullcontext(b'') if os.fstat(f.fileno()).st_size == 0
+            else mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)) as mm:
+        # Every edit is idempotent, so a file matching the digest recorded
+        # after the last full run needs no work at all
+        digest = _digest(mm)
+        if digest == _read_stamp():
+            print("✅ network.rs already up to date")
+            return
+
+        data = mm
+        changed = False
+        if fix:
+            data = fix_syntax(mm)
+            # fix_syntax only removes bytes, so an unchanged length means no-op
+            if len(data) != len(mm):
+                changed = True
+                print("✅ Fixed syntax error in network.rs")
+
+        content = str(data, 'utf-8')
+
+    # The literals below all use '\n'; normalize CRLF the way text-mode open()
+    # did and restore it on write
+    crlf = '\r\n' in content
+    if crlf:
+        content = content.replace('\r\n', '\n')
+
+    # Each edit returns the new text and whether its anchor (or its already
+    # applied result) was found. Report only the edits that changed something
+    complete = True
+    for edit, message in edits:
+        edited, found = edit(content)
+        if edited != content:
+            changed = True
+            print(message)
+        content = edited
+        complete = complete and found
+
+    # Leave an unchanged file alone so its mtime (and cargo's build cache for
+    # p2p) is not disturbed
+    if changed:
+        if crlf:
+            content = content.replace('\n', '\r\n')
+        out = content.encode('utf-8')
+        atomic_write(PATH, out)
+        digest = _digest(out)
+
+    # Only a full run in which every edit found its anchor leaves the file in
+    # its final state
+    if fix and edits is EDITS and complete:
+        with open(STAMP, 'w') as f:
+            f.write(digest + '\n')
+
+
+def run_only(*edits):
+    """Apply only the given edits from ``EDITS``, in ``EDITS`` order."""
+    run([entry for entry in EDITS if entry[0] in edits], fix=False)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,24 @@
+#!/bin/bash
+# Apply the p2p/src/network.rs edits from apply_edits.py
+# Skips starting Python when network.rs still matches the digest recorded by
+# the last full run
+
+set -e
+
+cd "$(dirname "$0")/.."
+
+# Must match PATH and STAMP in apply_edits.py
+NETWORK_RS="p2p/src/network.rs"
+STAMP="p2p/src/.network.rs.applied"
+
+# Same BLAKE2b-128 digest that apply_edits._digest() writes to the stamp file:
+# the driver's source followed by network.rs
+if [ -f "$STAMP" ] && command -v b2sum > /dev/null; then
+    digest=$(cat apply_edits.py "$NETWORK_RS" | b2sum -l 128 | cut -d ' ' -f 1)
+    if [ "$digest" = "$(cat "$STAMP")" ]; then
+        echo "✅ network.rs already up to date"
+        exit 0
+    fi
+fi
+
+exec python3 apply_edits.py
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 import re
 
+from apply_edits import literal_sub
+
 with open('node/src/main.rs', 'r') as f:
     content = f.read()
 
 # 1. Update imports
-content = content.replace(
+content = literal_sub(
+    content,
     'use boundless_p2p::{NetworkNode, NetworkConfig, Message};',
     'use boundless_p2p::{NetworkNode, NetworkConfig, NetworkHandle, NetworkEvent};'
 )